@@ -4,7 +4,102 @@ import pygame
 
 from config import Config
 
+# Bound methods of the shared module RNG (so random.seed() still applies),
+# saving an attribute lookup per call on the per-move path
+_random = random.random
+_randrange = random.randrange
+
+# The 8 possible headings / neighbor offsets as (dx, dy)
+HEADINGS = ((-1, -1), (0, -1), (1, -1),
+            (-1,  0),          (1,  0),
+            (-1,  1), (0,  1), (1,  1))
+
+# Moves allowed for each heading: straight ahead or a 45° turn either way
+TURNING_PATTERNS = {
+    (-1, -1): [(-1, -1), (0, -1), (-1, 0)],
+    (0, -1):  [(0, -1), (-1, -1), (1, -1)],
+    (1, -1):  [(1, -1), (0, -1), (1, 0)],
+    (-1, 0):  [(-1, 0), (-1, -1), (-1, 1)],
+    (1, 0):   [(1, 0), (1, -1), (1, 1)],
+    (-1, 1):  [(-1, 1), (0, 1), (-1, 0)],
+    (0, 1):   [(0, 1), (-1, 1), (1, 1)],
+    (1, 1):   [(1, 1), (0, 1), (1, 0)],
+}
+
+# Same patterns indexed by heading index into HEADINGS, so an ant only
+# visits the 3 offsets it may take instead of filtering all 8 neighbors
+_TURNING_OFFSETS = tuple(tuple(TURNING_PATTERNS[heading]) for heading in HEADINGS)
+
+# Heading index for a one-cell move, indexed by its (dy+1)*3 + (dx+1) code
+_CODE_TO_HEADING = tuple(
+    HEADINGS.index((dx, dy)) if (dx or dy) else None
+    for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+)
+
+# Heading index after a 180° turn
+_REVERSE_HEADING = tuple(HEADINGS.index((-dx, -dy)) for dx, dy in HEADINGS)
+
+# Step length for each neighbor offset, indexed the same way as the masks
+_SQRT2 = math.sqrt(2)
+_DIST9 = (_SQRT2, 1.0, _SQRT2,
+          1.0,    0.0, 1.0,
+          _SQRT2, 1.0, _SQRT2)
+
+# All 8 neighbor offsets as (dc, dr, code), in the order the old nested
+# loop produced them; code = (dr+1)*3 + (dc+1) indexes _DIST9
+_NEIGHBOR_OFFSETS = tuple((dc, dr, (dr + 1) * 3 + (dc + 1))
+                          for dc in (-1, 0, 1) for dr in (-1, 0, 1)
+                          if dc or dr)
+
+
+def _softmax_weights(scores, temperature):
+    """
+    Unnormalized softmax weights for a list of scores (log-sum-exp style).
+    Pure function of its arguments so it can be swapped for a compiled kernel.
+    """
+    # Find maximum score for numerical stability
+    max_score = max(scores)
+    
+    # If all scores are 0, use uniform distribution
+    if max_score == 0:
+        return [1.0] * len(scores)
+    
+    # Subtract max_score, cap very large negative values to prevent
+    # underflow (exp(-50) ≈ 1.9e-22) and exponentiate in one pass.
+    # The sampler takes unnormalized weights, so no need to divide
+    # by the total here (it falls back to uniform if they sum to 0).
+    exp = math.exp
+    inv_temperature = 1.0 / temperature
+    return [exp(max((s - max_score) * inv_temperature, -50)) for s in scores]
+
+
+def _weighted_index(weights):
+    """Pick an index with probability proportional to its (unnormalized) weight."""
+    total = sum(weights)
+    if total <= 0.0:
+        return _randrange(len(weights))
+
+    # Inverse CDF by linear scan - with at most 8 weights this beats
+    # building a cumulative list and bisecting it
+    u = _random() * total
+    for i, w in enumerate(weights):
+        u -= w
+        if u < 0.0:
+            return i
+    return len(weights) - 1  # Float rounding left u at ~0
+
+
 class Ant:
+    # Fixed attribute set: no per-instance __dict__ for the whole colony.
+    # Anything new assigned to an ant must be listed here.
+    __slots__ = (
+        'start_col', 'start_row', 'grid', 'has_food', 'just_changed_state',
+        'alpha', 'beta', 'temperature', 'explore_chance',
+        'base_strength', 'current_strength', 'strength_decay_rate', 'min_strength',
+        'heading_idx', 'steps_taken', 'distance_traveled',
+        'col', 'row', '_rect',
+    )
+
     def __init__(self, grid, start_col=None, start_row=None):
         """
         Initialize an ant at a specific grid position.
@@ -30,12 +125,11 @@ class Ant:
         self.min_strength = Config.PHEROMONE_MIN_DROP_STRENGTH
 
         # Direction persistence for smoother movement
-        self.heading = None  # (dx, dy) - will be initialized on first move
+        self.heading_idx = None  # index into HEADINGS - initialized below
         
         # Track movement
         self.steps_taken = 0
         self.distance_traveled = 0
-        self.path = []
         
         # Set starting position
         if start_col is not None and start_row is not None:
@@ -45,130 +139,105 @@ class Ant:
             # Find a random non-obstacle starting position
             self.col, self.row = self._find_random_start()
         
-        # Initialize tracking
-        self.path.append((self.col, self.row))
         self._initialize_heading()  # Initialize heading immediately
+        
+        # Created by draw() on first use, then reused
+        self._rect = None
     
     def _find_random_start(self):
         """Find a random cell that's not an obstacle."""
         while True:
-            col = random.randint(0, self.grid.cols - 1)
-            row = random.randint(0, self.grid.rows - 1)
+            col = random.randrange(self.grid.cols)
+            row = random.randrange(self.grid.rows)
             if not self.grid.is_obstacle(col, row):
                 return col, row
     
     def _initialize_heading(self):
         """Set random initial heading if not set."""
-        if self.heading is None:
+        if self.heading_idx is None:
             # Choose random direction from 8 possibilities
-            directions = [(-1, -1), (0, -1), (1, -1),
-                         (-1,  0),          (1,  0),
-                         (-1,  1), (0,  1), (1,  1)]
-            self.heading = random.choice(directions)
+            self.heading_idx = random.randrange(len(HEADINGS))
+    
+    @property
+    def heading(self):
+        """Current heading as a (dx, dy) tuple (None if not initialized)."""
+        if self.heading_idx is None:
+            return None
+        return HEADINGS[self.heading_idx]
     
     def _get_valid_neighbors(self):
-        """Get all valid neighboring cells."""
-        neighbors = []
-        for dc in [-1, 0, 1]:
-            for dr in [-1, 0, 1]:
-                if dc == 0 and dr == 0:
-                    continue  # Skip current position
-                
-                nc = self.col + dc
-                nr = self.row + dr
-                
-                # Check bounds and obstacles
-                if (0 <= nc < self.grid.cols and 
-                    0 <= nr < self.grid.rows and 
-                    not self.grid.is_obstacle(nc, nr)):
-                    neighbors.append((nc, nr, dc, dr))  # Include direction vectors
-        return neighbors
+        """
+        Get all valid neighboring cells as (col, row, code) tuples, where
+        code = (dr+1)*3 + (dc+1) indexes _DIST9.
+        """
+        col, row = self.col, self.row
+        obstacles = self.grid.obstacle_padded
+        stride = self.grid.padded_stride
+        base = (row + 1) * stride + col + 1
+        
+        # The padded border doubles as the bounds check
+        return [(col + dc, row + dr, code)
+                for dc, dr, code in _NEIGHBOR_OFFSETS
+                if not obstacles[base + dr * stride + dc]]
     
     def _get_allowed_neighbors(self):
-        """Return neighbors with equal cost (all moves count as 1)."""
-        if self.heading is None:
+        """
+        Return neighbors with equal cost (all moves count as 1).
+        If the heading blocks every move, fall back to all valid neighbors
+        weighted by step length, so the result is only empty when the ant
+        is boxed in.
+        """
+        if self.heading_idx is None:
             neighbors = self._get_valid_neighbors()
-            return [(nc, nr, 1.0) for nc, nr, dx, dy in neighbors]  # All moves cost 1
-        
-        turning_patterns = {
-            (-1, -1): [(-1, -1), (0, -1), (-1, 0)],
-            (0, -1):  [(0, -1), (-1, -1), (1, -1)],
-            (1, -1):  [(1, -1), (0, -1), (1, 0)],
-            (-1, 0):  [(-1, 0), (-1, -1), (-1, 1)],
-            (1, 0):   [(1, 0), (1, -1), (1, 1)],
-            (-1, 1):  [(-1, 1), (0, 1), (-1, 0)],
-            (0, 1):   [(0, 1), (-1, 1), (1, 1)],
-            (1, 1):   [(1, 1), (0, 1), (1, 0)],
-        }
+            return [(nc, nr, 1.0) for nc, nr, code in neighbors]  # All moves cost 1
         
-        allowed_offsets = turning_patterns.get(self.heading, [])
+        col, row = self.col, self.row
+        obstacles = self.grid.obstacle_padded
+        stride = self.grid.padded_stride
+        base = (row + 1) * stride + col + 1
         allowed_neighbors = []
         
-        for nc, nr, dx, dy in self._get_valid_neighbors():
-            if (dx, dy) in allowed_offsets:
+        # Build the result in one pass over the allowed offsets only.
+        # The padded border doubles as the bounds check.
+        for dx, dy in _TURNING_OFFSETS[self.heading_idx]:
+            if not obstacles[base + dy * stride + dx]:
                 # CHANGE: All moves have distance/cost of 1
-                allowed_neighbors.append((nc, nr, 1.0))  # Changed from math.sqrt(dx*dx + dy*dy)
+                allowed_neighbors.append((col + dx, row + dy, 1.0))  # Changed from math.sqrt(dx*dx + dy*dy)
+        
+        if not allowed_neighbors:
+            # No moves within turning radius, expand search
+            return [(nc, nr, _DIST9[code]) for nc, nr, code in self._get_valid_neighbors()]
         
         return allowed_neighbors
     
-    def _update_heading_from_move(self):
-        """Update heading based on the last movement."""
-        if len(self.path) < 2:
-            return
-        
-        prev_col, prev_row = self.path[-2]
-        curr_col, curr_row = self.path[-1]
+    def _commit_move(self, col, row, distance):
+        """Move to (col, row), update movement stats and heading."""
+        prev_col, prev_row = self.col, self.row
+        self.col, self.row = col, row
         
-        # Calculate direction vector
-        dx = curr_col - prev_col
-        dy = curr_row - prev_row
+        # Track actual distance, not just steps
+        self.distance_traveled += distance
+        self.steps_taken += 1
         
         # Only update heading if we actually moved
-        if dx != 0 or dy != 0:
-            self.heading = (dx, dy)
+        dx, dy = col - prev_col, row - prev_row
+        if dx or dy:
+            self.heading_idx = _CODE_TO_HEADING[(dy + 1) * 3 + (dx + 1)]
     
     def move_random(self):
         # Get neighbors with distances
         weighted_neighbors = self._get_allowed_neighbors()
-        
-        # If no moves within turning radius, expand search
         if not weighted_neighbors:
-            all_neighbors = self._get_valid_neighbors()
-            if not all_neighbors:
-                return False  # Stuck - no valid moves at all
-            
-            # Convert all valid neighbors to weighted format
-            weighted_neighbors = []
-            for nc, nr, dx, dy in all_neighbors:
-                distance = math.sqrt(dx*dx + dy*dy)
-                weighted_neighbors.append((nc, nr, distance))
+            return False  # Stuck - no valid moves at all
         
         # Create weights inversely proportional to distance
-        positions = []
-        weights = []
-        distances = []
-        
-        for nc, nr, distance in weighted_neighbors:
-            positions.append((nc, nr))
-            distances.append(distance)
-            # Prefer straight moves (lower distance)
-            weights.append(1.0 / distance)
+        # (prefer straight moves, i.e. lower distance)
+        weights = [1.0 / distance for nc, nr, distance in weighted_neighbors]
         
         # Choose with probability proportional to inverse distance
-        total_weight = sum(weights)
-        normalized = [w/total_weight for w in weights]
-        chosen_idx = random.choices(range(len(positions)), weights=normalized, k=1)[0]
-        
-        old_col, old_row = self.col, self.row
-        self.col, self.row = positions[chosen_idx]
-        distance = distances[chosen_idx]
-        
-        # Track actual distance, not just steps
-        self.distance_traveled += distance
-        self.steps_taken += 1
-        self.path.append((self.col, self.row))
-        self._update_heading_from_move()
+        nc, nr, distance = weighted_neighbors[_weighted_index(weights)]
         
+        self._commit_move(nc, nr, distance)
         return True
     
     def move_aco(self):
@@ -180,98 +249,70 @@ class Ant:
             explore_chance: Probability of random exploration (0-1)
             temperature: Controls exploration/exploitation (higher = more random)
         """
-        # Food pickup/dropoff logic
-        if self.has_food:
+        grid = self.grid
+        
+        has_food = self.has_food
+        cell = (self.col, self.row)
+        
+        # Food pickup/dropoff logic - only worth a method call on the few
+        # cells where it can actually happen (nest or food)
+        if has_food and cell in grid.nest_drop_cells:
             self._drop_food()
+            # Dropping may send the ant back to its start cell
+            has_food = self.has_food
+            cell = (self.col, self.row)
         
-        if not self.has_food:
+        if not has_food and cell in grid.food_cell_to_cluster:
             self._pickup_food()
+            has_food = self.has_food
         
         # Small chance to explore randomly
-        if random.random() < self.explore_chance:
+        if _random() < self.explore_chance:
             return self.move_random()
         
-        # Get allowed moves (respects heading restrictions)
+        # Get allowed moves (respects heading restrictions, falls back to
+        # all valid moves if the restricted set is empty)
         moves = self._get_allowed_neighbors()
-        if not moves:
-            # Fallback to all valid moves if restricted set is empty
-            moves = [(nc, nr, math.sqrt(dx*dx + dy*dy)) 
-                    for nc, nr, dx, dy in self._get_valid_neighbors()]
-        
         if not moves:
             return False
         
+        # Choose which pheromone and heuristic to follow based on state.
+        # Moves are already bounds-checked, so read the fields directly
+        # instead of going through the per-cell grid getters.
+        if has_food:
+            # Heading back to nest: follow NEST pheromones
+            pheromone_field = grid.pheromone_to_nest
+            heuristic_field = grid.heuristic_to_nest
+        else:
+            # Searching for food: follow FOOD pheromones
+            pheromone_field = grid.pheromone_to_food
+            heuristic_field = grid.heuristic_to_food
+        
         # Calculate "attractiveness" scores using ACO formula: (pheromone^α) * (heuristic^β)
-        scores = []
-        
-        for col, row, dist in moves:
-            # Choose which pheromone and heuristic to follow based on state
-            if self.has_food:
-                # Heading back to nest: follow NEST pheromones
-                pheromone = self.grid.get_pheromone_to_nest(col, row)
-                heuristic = self.grid.get_heuristic_to_nest(col, row)
-            else:
-                # Searching for food: follow FOOD pheromones
-                pheromone = self.grid.get_pheromone_to_food(col, row)
-                heuristic = self.grid.get_heuristic_to_food(col, row)
-            
-            # ACO attractiveness score
-            p = (pheromone + 0.01) ** self.alpha
-            h = (heuristic + 0.01) ** self.beta
-            
-            # Combine and normalize by distance (prefer shorter moves)
-            score = (p * h)
-            scores.append(score)
+        alpha = self.alpha
+        beta = self.beta
+        scores = [((pheromone_field[row][col] + 0.01) ** alpha) *
+                  ((heuristic_field[row][col] + 0.01) ** beta)
+                  for col, row, dist in moves]
         
         # NUMERICALLY STABLE SOFTMAX with temperature
         # Use log-sum-exp trick to prevent overflow
         
-        if self.temperature <= 0:
-            self.temperature = 0.001  # Avoid division by zero
+        temperature = self.temperature
+        if temperature <= 0:
+            temperature = self.temperature = 0.001  # Avoid division by zero
         
-        # Find maximum score for numerical stability
-        max_score = max(scores)
-        
-        # If all scores are 0, use uniform distribution
-        if max_score == 0:
-            probs = [1.0 / len(scores)] * len(scores)
-        else:
-            # Subtract max_score for numerical stability
-            scaled_scores = [(s - max_score) / self.temperature for s in scores]
-            
-            # Cap very large negative values to prevent underflow
-            scaled_scores = [max(s, -50) for s in scaled_scores]  # exp(-50) ≈ 1.9e-22
-            
-            # Calculate exponentials
-            exp_scores = [math.exp(s) for s in scaled_scores]
-            total_exp = sum(exp_scores)
-            
-            # If total_exp is 0 (all scores were -inf after scaling), fallback to uniform
-            if total_exp == 0:
-                probs = [1.0 / len(scores)] * len(scores)
-            else:
-                probs = [es / total_exp for es in exp_scores]
+        probs = _softmax_weights(scores, temperature)
         
         # Choose move based on probabilities
-        idx = random.choices(range(len(moves)), weights=probs, k=1)[0]
+        idx = _weighted_index(probs)
         col, row, dist = moves[idx]
         
         # Deposit pheromone BEFORE moving (at current position)
         self._deposit_pheromone()
         
         # Update position
-        self.col, self.row = col, row
-        self.distance_traveled += dist
-        self.steps_taken += 1
-        self.path.append((col, row))
-        
-        # Update heading
-        if len(self.path) >= 2:
-            prev = self.path[-2]
-            dx, dy = col - prev[0], row - prev[1]
-            if dx or dy:
-                self.heading = (dx, dy)
-        
+        self._commit_move(col, row, dist)
         return True
     
     def _deposit_pheromone(self):
@@ -279,12 +320,14 @@ class Ant:
         # Current strength decays over time/steps
         current_strength = self.current_strength
         
+        # The ant's own cell is always in bounds, so write the field
+        # directly instead of going through grid.add_pheromone
         if self.has_food:
             # Heading to nest: deposit FOOD pheromone
-            self.grid.add_pheromone(self.col, self.row, "to_food", current_strength*1.5)
+            self.grid.pheromone_to_food[self.row][self.col] += current_strength*1.5
         else:
             # Searching for food: deposit NEST pheromone  
-            self.grid.add_pheromone(self.col, self.row, "to_nest", current_strength)
+            self.grid.pheromone_to_nest[self.row][self.col] += current_strength
         
         # Decay strength for next deposit
         self.current_strength *= self.strength_decay_rate
@@ -310,22 +353,20 @@ class Ant:
     
     def _reverse_direction(self):
         """Reverse the ant's heading (180° turn)."""
-        if self.heading is not None:
-            hx, hy = self.heading
-            self.heading = (-hx, -hy)
+        if self.heading_idx is not None:
+            self.heading_idx = _REVERSE_HEADING[self.heading_idx]
     
     def _pickup_food(self):
         """Try to pick up food from current cell."""
-        if not self.has_food and self.grid.has_food(self.col, self.row):
-            # Find which cluster has food here
-            for cluster in self.grid.food_clusters:
-                if (self.col, self.row) in cluster.food_cells:
-                    if cluster.take_food(self.col, self.row) > 0:
-                        self.has_food = True
-                        #print(f"✓ Ant picked up food at ({self.col}, {self.row})")  # Optional debug
-                        self._reset_strength()
-                        self._reverse_direction()
-                        return True
+        if not self.has_food:
+            # Find which cluster has food here (None for most cells)
+            cluster = self.grid.food_cell_to_cluster.get((self.col, self.row))
+            if cluster is not None and cluster.take_food(self.col, self.row) > 0:
+                self.has_food = True
+                #print(f"✓ Ant picked up food at ({self.col}, {self.row})")  # Optional debug
+                self._reset_strength()
+                self._reverse_direction()
+                return True
         return False
     
     def _drop_food(self):
@@ -347,15 +388,9 @@ class Ant:
 
     def _at_nest(self):
         """Check if ant is within nest radius."""
-        if self.grid.nest_position is None:
-            return False
-            
-        nest_col, nest_row = self.grid.nest_position
-        dx = self.col - nest_col
-        dy = self.row - nest_row
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        return distance <= Config.NEST_RADIUS
+        # The grid precomputes the cells within Config.NEST_RADIUS whenever
+        # the nest moves (empty set if there is no nest)
+        return (self.col, self.row) in self.grid.nest_drop_cells
     
     def reset(self):
         """Resets ants to nest. Resets to base init states"""
@@ -377,13 +412,10 @@ class Ant:
         # Get the top-left corner of the cell
         x, y = self.grid.grid_to_world(self.col, self.row)
         
-        # Create a rectangle that fills the entire cell
-        cell_rect = pygame.Rect(
-            int(x), 
-            int(y), 
-            self.grid.cell_size, 
-            self.grid.cell_size
-        )
+        # Move the ant's cell-sized rectangle instead of allocating a new one
+        if self._rect is None:
+            self._rect = pygame.Rect(0, 0, self.grid.cell_size, self.grid.cell_size)
+        self._rect.topleft = (int(x), int(y))
         
         # Draw the ant as a filled rectangle
-        pygame.draw.rect(surface, color, cell_rect)
\ No newline at end of file
+        pygame.draw.rect(surface, color, self._rect)
\ No newline at end of file
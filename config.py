@@ -23,7 +23,10 @@ class Config:
     FOOD_CLUSTER_DENSITY = 1
     FOOD_PER_CELL = 10
     FOOD_CLUSTER_INFLUENCE_RADIUS_MULT = 10
-    FOOD_COLOR = (0, 180, 0)  # Green
+    INITIAL_FOOD_SOURCES = 5
+    FOOD_PER_SOURCE = 50
+    FOOD_COLOR = (0, 255, 0)  # GREEN
+    FOOD_RESPAWN = True
     
     # ===== ANT BEHAVIOR =====
     ANT_COLOR = (0, 0, 0)  # BLACK
@@ -47,12 +50,6 @@ class Config:
     TO_FOOD_PHEROMONE_COLOR = (255, 0, 0)    # RED
     TO_NEST_PHEROMONE_COLOR = (0, 0, 255)  # BLUE
     
-    # ===== FOOD SETTINGS =====
-    INITIAL_FOOD_SOURCES = 5
-    FOOD_PER_SOURCE = 50
-    FOOD_COLOR = (0, 255, 0)  # GREEN
-    FOOD_RESPAWN = True
-    
     # ===== OBSTACLES =====
     OBSTACLE_COLOR = (100, 70, 55)
 
@@ -88,4 +85,5 @@ class Debug:
     DRAW_ANT_IDS = False
     DRAW_PHEROMONE_VALUES = False
     DRAW_HEURISTIC_VALUES = False
-    LOG_MOVEMENT = False
\ No newline at end of file
+    LOG_MOVEMENT = False
+    LOG_EDITOR = False  # Per-stroke editor messages (printed on every brush cell)
\ No newline at end of file
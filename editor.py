@@ -1,7 +1,6 @@
 import pygame
-import math
 
-from config import Config
+from config import Config, Debug
 
 class Editor:
     def __init__(self, grid, ant_list_ref):
@@ -32,6 +31,10 @@ class Editor:
         self.show_preview = True
         self.preview_alpha = 100  # Semi-transparent
         
+        # Rendered UI text, reused until the values shown change
+        self._ui_cache_key = None
+        self._ui_surfaces = None
+        
     def handle_keyboard(self, event):
         """Handle keyboard shortcuts for editor."""
         handled = True
@@ -70,7 +73,6 @@ class Editor:
         """Handle editor-specific events."""
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click - draw with current tool
-                print("CLICK")
                 self.is_drawing = True
                 self.apply_tool_at_position(event.pos, event.button)
                 return True
@@ -138,14 +140,14 @@ class Editor:
     def erase_food_circle(self, center_col, center_row):
         """Erase only food clusters in a circular area (doesn't erase obstacles or ants)."""
         clusters_to_remove = []
+        radius_sq = self.brush_size * self.brush_size
         
         for cluster in self.grid.food_clusters:
             # Check if cluster center is within erase radius
             dx = cluster.grid_x - center_col
             dy = cluster.grid_y - center_row
-            distance = math.sqrt(dx*dx + dy*dy)
             
-            if distance <= self.brush_size:
+            if dx*dx + dy*dy <= radius_sq:
                 clusters_to_remove.append(cluster)
         
         # Remove clusters from grid
@@ -154,69 +156,57 @@ class Editor:
             for col, row in cluster.food_cells:
                 self.grid.remove_food(col, row)
             
-            # Remove cluster from grid's list
-            self.grid.food_clusters.remove(cluster)
-            
-            print(f"✓ Deleted food cluster at ({cluster.grid_x}, {cluster.grid_y})")
+            if Debug.LOG_EDITOR:
+                print(f"✓ Deleted food cluster at ({cluster.grid_x}, {cluster.grid_y})")
+        
+        # Remove clusters from grid's list in one pass (in place, so
+        # references to the list stay valid)
+        removed = set(clusters_to_remove)
+        self.grid.food_clusters[:] = [cluster for cluster in self.grid.food_clusters
+                                      if cluster not in removed]
         
         # Update heuristics after deleting clusters
         if clusters_to_remove:
             self.grid.update_heuristic_to_food()
-            print(f"✓ Updated food heuristics after deleting {len(clusters_to_remove)} clusters")
+            if Debug.LOG_EDITOR:
+                print(f"✓ Updated food heuristics after deleting {len(clusters_to_remove)} clusters")
+
+    def _brush_cells(self, center_col, center_row):
+        """
+        Yield every in-bounds cell of the filled brush disk, i.e. within
+        brush_size - 1 cells of the center (the center alone for size 1).
+        """
+        radius = self.brush_size - 1
+        radius_sq = radius * radius
+        for row in range(max(0, center_row - radius), min(self.grid.rows - 1, center_row + radius) + 1):
+            dy = row - center_row
+            for col in range(max(0, center_col - radius), min(self.grid.cols - 1, center_col + radius) + 1):
+                dx = col - center_col
+                if dx*dx + dy*dy <= radius_sq:
+                    yield col, row
 
-    def erase_ants_in_circle(self, center_col, center_row):
-        """Remove ants in a circular area (doesn't erase obstacles or food)."""
-        ants_to_remove = []
-        
-        for ant in self.ants:
-            dx = ant.col - center_col
-            dy = ant.row - center_row
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            if distance <= self.brush_size:
-                ants_to_remove.append(ant)
-        
-        # Remove ants
-        for ant in ants_to_remove:
-            self.ants.remove(ant)
-        
-        if ants_to_remove:
-            print(f"✓ Removed {len(ants_to_remove)} ants")
-    
     def draw_obstacle_circle(self, center_col, center_row, is_obstacle=True):
         """Draw/erase obstacles in a circular brush."""
-        for r in range(self.brush_size):
-            radius = r
-            for angle in range(0, 360, 10):  # Sample points around circle
-                rad = math.radians(angle)
-                col = int(center_col + radius * math.cos(rad))
-                row = int(center_row + radius * math.sin(rad))
-                
-                if 0 <= col < self.grid.cols and 0 <= row < self.grid.rows:
-                    self.grid.set_obstacle(col, row, is_obstacle)
-        
-        # Fill the center
-        self.grid.set_obstacle(center_col, center_row, is_obstacle)
-        print(f"✓ {'Added' if is_obstacle else 'Removed'} obstacles in radius {self.brush_size}")
+        # Fill the whole disk - sampling points along rings left gaps
+        # and visited some cells several times
+        for col, row in self._brush_cells(center_col, center_row):
+            self.grid.set_obstacle(col, row, is_obstacle)
+        if Debug.LOG_EDITOR:
+            print(f"✓ {'Added' if is_obstacle else 'Removed'} obstacles in radius {self.brush_size}")
         
     def erase_ants_in_circle(self, center_col, center_row):
         """Remove ants in a circular area."""
-        ants_to_remove = []
+        radius_sq = self.brush_size * self.brush_size
+        ant_count = len(self.ants)
         
-        for ant in self.ants:
-            dx = ant.col - center_col
-            dy = ant.row - center_row
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            if distance <= self.brush_size:
-                ants_to_remove.append(ant)
-        
-        # Remove ants
-        for ant in ants_to_remove:
-            self.ants.remove(ant)
+        # Keep ants outside the brush. Filter in place so the simulation's
+        # list reference stays valid, in one pass instead of a remove() each
+        self.ants[:] = [ant for ant in self.ants
+                        if (ant.col - center_col) ** 2 + (ant.row - center_row) ** 2 > radius_sq]
         
-        if ants_to_remove:
-            print(f"✓ Removed {len(ants_to_remove)} ants")
+        removed = ant_count - len(self.ants)
+        if removed and Debug.LOG_EDITOR:
+            print(f"✓ Removed {removed} ants")
     
     def place_food_cluster(self, center_col, center_row):
         """Place a food cluster at the clicked position."""
@@ -234,7 +224,9 @@ class Editor:
             density=Config.FOOD_CLUSTER_DENSITY,
             food_per_cell=Config.FOOD_PER_CELL
         )
-        print(f"✓ Placed food cluster at ({center_col}, {center_row}) radius={self.brush_size}")
+        if Debug.LOG_EDITOR:
+            print(f"✓ Placed food cluster at ({center_col}, {center_row}) "
+                  f"radius={self.brush_size}, food={cluster.total_food}")
     
     def place_ant(self, col, row):
         """Place an ant at the clicked position."""
@@ -244,43 +236,26 @@ class Editor:
         if not self.grid.is_obstacle(col, row):
             new_ant = Ant(self.grid, col, row)
             self.ants.append(new_ant)
-            print(f"✓ Placed ant at ({col}, {row}) - Total ants: {len(self.ants)}")
+            if Debug.LOG_EDITOR:
+                print(f"✓ Placed ant at ({col}, {row}) - Total ants: {len(self.ants)}")
 
     def draw_pheromone_circle(self, center_col, center_row, add_pheromone=True):
         """Draw/erase pheromones in a circular brush."""
-        for r in range(self.brush_size):
-            radius = r
-            for angle in range(0, 360, 10):
-                rad = math.radians(angle)
-                col = int(center_col + radius * math.cos(rad))
-                row = int(center_row + radius * math.sin(rad))
-                
-                if 0 <= col < self.grid.cols and 0 <= row < self.grid.rows:
-                    if add_pheromone:
-                        # Add full strength pheromone of the selected type
-                        strength = Config.PHEROMONE_MAX_STRENGTH
-                        self.grid.set_pheromone(col, row, "to_food", strength)
-                        self.grid.set_pheromone(col, row, "to_nest", strength)
-                    else:
-                        # REMOVE BOTH TYPES when erasing
-                        self.grid.set_pheromone(col, row, "to_food", 0.0)
-                        self.grid.set_pheromone(col, row, "to_nest", 0.0)
+        # Add full strength pheromone, or REMOVE BOTH TYPES when erasing
+        strength = Config.PHEROMONE_MAX_STRENGTH if add_pheromone else 0.0
         
-        # Fill the center
-        if add_pheromone:
-            strength = Config.PHEROMONE_MAX_STRENGTH
-            self.grid.set_pheromone(center_col, center_row, "to_food", strength)
-            self.grid.set_pheromone(center_col, center_row, "to_nest", strength)
-        else:
-            # REMOVE BOTH TYPES in center when erasing
-            self.grid.set_pheromone(center_col, center_row, "to_food", 0.0)
-            self.grid.set_pheromone(center_col, center_row, "to_nest", 0.0)
+        # Same filled disk as the obstacle brush (includes the center).
+        # Its cells are already in bounds, so write the fields directly
+        # instead of going through grid.set_pheromone
+        pheromone_to_food = self.grid.pheromone_to_food
+        pheromone_to_nest = self.grid.pheromone_to_nest
+        for col, row in self._brush_cells(center_col, center_row):
+            pheromone_to_food[row][col] = strength
+            pheromone_to_nest[row][col] = strength
     
     def clear_all_obstacles(self):
         """Clear all obstacles from the grid."""
-        for row in range(self.grid.rows):
-            for col in range(self.grid.cols):
-                self.grid.set_obstacle(col, row, False)
+        self.grid.clear_obstacles()
         print("✓ Cleared all obstacles")
     
     def draw_brush_preview(self, surface, mouse_pos):
@@ -320,12 +295,20 @@ class Editor:
     
     def draw_ui(self, surface, font):
         """Draw editor UI information."""
-        # Tool info
-        tool_text = f"Tool: {self.current_tool.upper()} (Size: {self.brush_size})"
-        tool_surface = font.render(tool_text, True, (0, 0, 0))
-        surface.blit(tool_surface, (10, 35))
+        # Only re-render the text when something shown in it changed
+        key = (font, self.current_tool, self.brush_size, len(self.ants))
+        if key != self._ui_cache_key:
+            # Tool info
+            tool_text = f"Tool: {self.current_tool.upper()} (Size: {self.brush_size})"
+            tool_surface = font.render(tool_text, True, (0, 0, 0))
+            
+            # Ant count
+            ant_text = f"Ants: {len(self.ants)}"
+            ant_surface = font.render(ant_text, True, (0, 0, 0))
+            
+            self._ui_cache_key = key
+            self._ui_surfaces = (tool_surface, ant_surface)
         
-        # Ant count
-        ant_text = f"Ants: {len(self.ants)}"
-        ant_surface = font.render(ant_text, True, (0, 0, 0))
+        tool_surface, ant_surface = self._ui_surfaces
+        surface.blit(tool_surface, (10, 35))
         surface.blit(ant_surface, (10, 60))
\ No newline at end of file
@@ -5,6 +5,12 @@ import pygame
 from config import Config
 
 class FoodCluster:
+    __slots__ = (
+        'grid', 'grid_x', 'grid_y', 'radius', 'density', 'food_per_cell',
+        'influence_radius_multiplier', 'gaussian_std',
+        'food_cells', 'total_food', 'cluster_index', '_blit_cache',
+    )
+
     def __init__(self, grid, grid_x, grid_y, radius, density, food_per_cell=1, 
                  influence_radius_multiplier=3.0, gaussian_std=None):
         """
@@ -31,6 +37,7 @@ class FoodCluster:
         # Generate foods with Gaussian distribution
         self.food_cells = self.generate_foods_gaussian()
         self.total_food = len(self.food_cells) * self.food_per_cell
+        self._blit_cache = None  # (cell_size, blit sequence), see draw()
         
         # Register with grid
         self.cluster_index = self.grid.add_food_cluster(self)
@@ -51,8 +58,6 @@ class FoodCluster:
         Ensures no overlapping food cells.
         """
         food_cells = []
-        attempts = 0
-        max_attempts = self.radius * self.radius * 100  # Reasonable limit
         
         # Calculate number of potential food cells based on area and density
         circle_area = math.pi * self.radius * self.radius
@@ -67,23 +72,34 @@ class FoodCluster:
         min_row = max(0, self.grid_y - self.radius)
         max_row = min(self.grid.rows - 1, self.grid_y + self.radius)
         
+        radius_sq = self.radius * self.radius
+        obstacles = self.grid.obstacles
+        
+        # The density-adjusted Gaussian only depends on the squared
+        # distance, which many cells share - evaluate it once per value
+        prob_by_dist_sq = {}
+        
         # First pass: collect all possible positions with their probabilities
+        # (bounding box is already clipped to the grid, so index directly)
         for col in range(min_col, max_col + 1):
+            dx = col - self.grid_x
             for row in range(min_row, max_row + 1):
-                dx = col - self.grid_x
                 dy = row - self.grid_y
-                distance = math.sqrt(dx*dx + dy*dy)
+                dist_sq = dx*dx + dy*dy
                 
-                if distance <= self.radius:
+                if dist_sq <= radius_sq:
                     # Check if cell is not an obstacle
-                    if not self.grid.is_obstacle(col, row):
-                        # Calculate Gaussian probability
-                        prob = self.gaussian_probability(distance)
-                        # Adjust by overall density
-                        adjusted_prob = prob * self.density
+                    if not obstacles[row][col]:
+                        adjusted_prob = prob_by_dist_sq.get(dist_sq)
+                        if adjusted_prob is None:
+                            # Calculate Gaussian probability
+                            prob = self.gaussian_probability(math.sqrt(dist_sq))
+                            # Adjust by overall density
+                            adjusted_prob = prob * self.density
+                            prob_by_dist_sq[dist_sq] = adjusted_prob
                         
                         if adjusted_prob > 0.001:  # Skip very low probabilities
-                            candidates.append((col, row, adjusted_prob, distance))
+                            candidates.append((col, row, adjusted_prob))
         
         # Sort candidates by probability (highest first)
         candidates.sort(key=lambda x: x[2], reverse=True)
@@ -91,27 +107,20 @@ class FoodCluster:
         # Select food cells ensuring no overlap
         selected_positions = set()
         
-        for col, row, prob, distance in candidates:
+        # Every candidate is visited at most once, so this loop is bounded
+        # by the bounding box - no separate attempt limit is needed
+        for col, row, prob in candidates:
             if len(food_cells) >= target_food_cells:
                 break
-                
-            attempts += 1
-            if attempts > max_attempts:
-                break
             
             # Skip if cell already has food (from another cluster or this one)
             if self.grid.has_food(col, row):
                 continue
             
-            # Check minimum distance from other food cells in this cluster
-            too_close = False
-            for fc_col, fc_row in selected_positions:
-                dist_to_other = math.sqrt((col - fc_col)**2 + (row - fc_row)**2)
-                if dist_to_other < 1.0:  # Minimum 1 cell apart (no direct neighbors)
-                    too_close = True
-                    break
-            
-            if too_close:
+            # Check minimum distance from other food cells in this cluster.
+            # Cells are integer coordinates, so "closer than 1.0" can only
+            # mean the same cell - a set lookup instead of a scan.
+            if (col, row) in selected_positions:
                 continue
             
             # Probabilistic placement based on Gaussian probability
@@ -148,15 +157,9 @@ class FoodCluster:
             if self.grid.has_food(col, row):
                 continue
             
-            # Check minimum distance from other selected cells
-            too_close = False
-            for fc_col, fc_row in selected_positions:
-                dist_to_other = math.sqrt((col - fc_col)**2 + (row - fc_row)**2)
-                if dist_to_other < 1.0:
-                    too_close = True
-                    break
-            
-            if too_close:
+            # Check minimum distance from other selected cells (same cell only,
+            # see generate_foods_gaussian)
+            if (col, row) in selected_positions:
                 continue
             
             # Gaussian probability
@@ -214,9 +217,13 @@ class FoodCluster:
                 
                 if food_obj.amount <= 0:
                     self.grid.remove_food(col, row)
-                    # Remove from our list if empty
-                    if (col, row) in self.food_cells:
+                    # Remove from our list if empty (one scan, not a
+                    # membership test followed by remove())
+                    try:
                         self.food_cells.remove((col, row))
+                    except ValueError:
+                        pass
+                    self._blit_cache = None
                 
                 return amount_taken
         return 0
@@ -227,29 +234,32 @@ class FoodCluster:
     def get_remaining_food(self):
         return self.total_food
     
+    # Pre-filled food sprite per cell size, shared by all clusters
+    _food_sprites = {}
+    
     def draw(self, surface, cell_size):
-        # Draw food cells
-        last_x, last_y = None, None  # Store last position for drawing info
+        # Fixed size and color for all food
+        food_size = cell_size // 2
+        sprite = FoodCluster._food_sprites.get(cell_size)
+        if sprite is None:
+            sprite = pygame.Surface((food_size, food_size))
+            sprite.fill(Config.FOOD_COLOR)
+            FoodCluster._food_sprites[cell_size] = sprite
         
-        for col, row in self.food_cells:
-            food_obj = self.grid.get_food(col, row)
-            if food_obj and food_obj.amount > 0:
-                # Get CENTER of the cell (not top-left)
-                center_x, center_y = self.grid.grid_to_world_center(col, row)
-                last_x, last_y = center_x, center_y  # Update last position
-                
-                # Fixed size for all food
-                food_size = cell_size // 2
-                
-                # Calculate top-left corner from center
-                food_x = center_x - food_size // 2
-                food_y = center_y - food_size // 2
-                
-                # Fixed color
-                color = Config.FOOD_COLOR
-                
-                pygame.draw.rect(surface, color,
-                                (food_x, food_y, food_size, food_size))
+        # Positions only change when a cell runs out (take_food clears the
+        # cache), so build the blit sequence once instead of every frame
+        if self._blit_cache is None or self._blit_cache[0] != cell_size:
+            # Top-left of a food square centered in its cell
+            offset = cell_size // 2 - food_size // 2
+            foods = self.grid.foods
+            self._blit_cache = (cell_size, [
+                (sprite, (col * cell_size + offset, row * cell_size + offset))
+                for col, row in self.food_cells
+                if (col, row) in foods and foods[(col, row)].amount > 0
+            ])
+        
+        # Draw food cells in a single batched blit
+        surface.blits(self._blit_cache[1], False)
         
         # Draw cluster info only if we have at least one food cell drawn
         '''if last_x is not None and last_y is not None:
@@ -263,6 +273,8 @@ class FoodCluster:
 
 
 class Food:
+    __slots__ = ('col', 'row', 'amount')
+
     def __init__(self, col, row, amount):
         self.col = col
         self.row = row
@@ -16,13 +16,27 @@ class Grid:
         self.pheromone_to_nest = [[0.0] * self.cols for _ in range(self.rows)]
         self.heuristic_to_food = [[0.0] * self.cols for _ in range(self.rows)]
         self.heuristic_to_nest = [[0.0] * self.cols for _ in range(self.rows)]
-        self.foods = [[None] * self.cols for _ in range(self.rows)]
+        self.foods = {}  # (col, row) -> Food, only for cells holding food
         self.obstacles = [[False] * self.cols for _ in range(self.rows)]
 
+        # Flat copy of the obstacle map with a 1-cell border of obstacles,
+        # so hot neighbor checks need neither bounds tests nor method calls.
+        # Cell (col, row) lives at index (row + 1) * padded_stride + (col + 1).
+        self.padded_stride = self.cols + 2
+        self.obstacle_padded = bytearray(b"\x01" * (self.padded_stride * (self.rows + 2)))
+        for row in range(self.rows):
+            start = (row + 1) * self.padded_stride + 1
+            self.obstacle_padded[start:start + self.cols] = bytes(self.cols)
+
         self.nest_position = None
         self.nest_cells = []
+        self.nest_drop_cells = set()  # Cells where ants can drop off food
 
         self.food_clusters = []
+        self.food_cell_to_cluster = {}  # (col, row) -> owning FoodCluster
+        # Set when obstacles or food counts change after the last full
+        # heuristic_to_food rebuild, so the grid no longer matches them
+        self._food_heuristic_stale = False
         self.food_dropped = 0
         self.food_dropped_this_frame = 0
 
@@ -64,6 +78,7 @@ class Grid:
         
         # Calculate which cells are in nest radius
         self._update_nest_cells()
+        self._update_nest_drop_cells()
         
         # Set max pheromone in nest area
         self._set_nest_pheromones()
@@ -88,17 +103,33 @@ class Grid:
         max_col = min(self.cols - 1, nest_col + Config.NEST_PHEROMONE_RADIUS)
         min_row = max(0, nest_row - Config.NEST_PHEROMONE_RADIUS)
         max_row = min(self.rows - 1, nest_row + Config.NEST_PHEROMONE_RADIUS)
+        radius_sq = Config.NEST_PHEROMONE_RADIUS * Config.NEST_PHEROMONE_RADIUS
         
         for col in range(min_col, max_col + 1):
             for row in range(min_row, max_row + 1):
                 # Calculate distance from nest center
                 dx = col - nest_col
                 dy = row - nest_row
-                distance = math.sqrt(dx*dx + dy*dy)
                 
-                if distance <= Config.NEST_PHEROMONE_RADIUS:
+                if dx*dx + dy*dy <= radius_sq:
                     self.nest_cells.append((col, row))
     
+    def _update_nest_drop_cells(self):
+        """Calculate which cells are within the food drop-off radius (Config.NEST_RADIUS)."""
+        self.nest_drop_cells = set()
+        if self.nest_position is None:
+            return
+        
+        nest_col, nest_row = self.nest_position
+        radius = Config.NEST_RADIUS
+        
+        for col in range(max(0, nest_col - radius), min(self.cols - 1, nest_col + radius) + 1):
+            for row in range(max(0, nest_row - radius), min(self.rows - 1, nest_row + radius) + 1):
+                dx = col - nest_col
+                dy = row - nest_row
+                if dx*dx + dy*dy <= radius * radius:
+                    self.nest_drop_cells.add((col, row))
+    
     def _set_nest_pheromones(self):
         """Set maximum pheromone values in nest area."""
         if not self.nest_cells:
@@ -115,26 +146,25 @@ class Grid:
         nest_col, nest_row = self.nest_position
         dx = col - nest_col
         dy = row - nest_row
-        distance = math.sqrt(dx*dx + dy*dy)
         
-        return distance <= Config.NEST_PHEROMONE_RADIUS
+        return dx*dx + dy*dy <= Config.NEST_PHEROMONE_RADIUS * Config.NEST_PHEROMONE_RADIUS
     
     # Pheromone Methods
     def get_pheromone_to_food(self, grid_col, grid_row):
         """Get food pheromone strength at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
             return self.pheromone_to_food[grid_row][grid_col]
         return 0.0
     
     def get_pheromone_to_nest(self, grid_col, grid_row):
         """Get nest pheromone strength at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
             return self.pheromone_to_nest[grid_row][grid_col]
         return 0.0
     
     def add_pheromone(self, grid_col, grid_row, p_type, strength):
         """Add pheromone to a specific cell."""
-        if not self._in_bounds(grid_col, grid_row):
+        if not (0 <= grid_row < self.rows and 0 <= grid_col < self.cols):
             return False
             
         if p_type == "to_food":
@@ -145,7 +175,7 @@ class Grid:
     
     def set_pheromone(self, grid_col, grid_row, p_type, strength):
         """Set pheromone to a specific value."""
-        if not self._in_bounds(grid_col, grid_row):
+        if not (0 <= grid_row < self.rows and 0 <= grid_col < self.cols):
             return False
             
         if p_type == "to_food":
@@ -156,28 +186,24 @@ class Grid:
     
     def _evaporate_pheromones(self):
         """Apply evaporation to both pheromone grids."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                # Evaporate food pheromones
-                self.pheromone_to_food[row][col] *= (1 - Config.EVAPORATION_RATE)
-                # Evaporate nest pheromones (could use different rate if desired)
-                self.pheromone_to_nest[row][col] *= (1 - Config.EVAPORATION_RATE)
-                
-                # Cap at maximum and floor at minimum
-                self.pheromone_to_food[row][col] = min(
-                    self.pheromone_to_food[row][col], 
-                    Config.PHEROMONE_MAX_STRENGTH
-                )
-                self.pheromone_to_nest[row][col] = min(
-                    self.pheromone_to_nest[row][col], 
-                    Config.PHEROMONE_MAX_STRENGTH
-                )
-                
-                # Floor very low values to 0
-                if self.pheromone_to_food[row][col] < 0.01:
-                    self.pheromone_to_food[row][col] = 0
-                if self.pheromone_to_nest[row][col] < 0.01:
-                    self.pheromone_to_nest[row][col] = 0
+        retain = 1 - Config.EVAPORATION_RATE
+        max_strength = Config.PHEROMONE_MAX_STRENGTH
+        
+        # Same rate for both grids (could use different rates if desired)
+        for pheromone in (self.pheromone_to_food, self.pheromone_to_nest):
+            for row in range(self.rows):
+                decayed = [value * retain for value in pheromone[row]]
+                # Cap at maximum and floor very low values to 0
+                pheromone[row] = [0 if value < 0.01 else max_strength if value > max_strength else value
+                                  for value in decayed]
+    
+    # Diffusion weight per neighbor offset (dc, dr).
+    # Closer neighbors get more pheromone than diagonals.
+    DIFFUSION_WEIGHTS = {
+        (-1, -1): 0.71, (0, -1): 1, (1, -1): 0.71,
+        (-1,  0): 1,             (1,  0): 1,
+        (-1,  1): 0.71, (0,  1): 1, (1,  1): 0.71
+    }
     
     def _diffuse_pheromones(self):
         """
@@ -187,48 +213,73 @@ class Grid:
         if Config.DIFFUSION_RATE <= 0:
             return
         
-        # Weight matrix
-        WEIGHT_MATRIX = {
-            (-1, -1): 0.71, (0, -1): 1, (1, -1): 0.71,
-            (-1,  0): 1,             (1,  0): 1,
-            (-1,  1): 0.71, (0,  1): 1, (1,  1): 0.71
-        }
+        self.pheromone_to_food = self._diffuse_field(self.pheromone_to_food)
+        self.pheromone_to_nest = self._diffuse_field(self.pheromone_to_nest)
+    
+    def _diffuse_field(self, pheromone):
+        """
+        Return a diffused copy of one pheromone grid.
+        
+        Each cell keeps (1 - DIFFUSION_RATE) of its value and sends the rest
+        to its in-bounds, non-obstacle neighbors by weight. Instead of
+        scattering cell by cell, every row gathers what it receives with
+        shifted row slices, adding the contributions in the same (row-major
+        source) order so the result matches the scatter exactly.
+        """
+        rate = Config.DIFFUSION_RATE
+        keep = 1 - rate
+        total_weight = sum(self.DIFFUSION_WEIGHTS.values())
+        # Share of the sent amount that goes in direction (dc, dr)
+        share = {offset: weight / total_weight
+                 for offset, weight in self.DIFFUSION_WEIGHTS.items()}
+        to_down_right = share[(1, 1)]
+        to_down = share[(0, 1)]
+        to_down_left = share[(-1, 1)]
+        to_right = share[(1, 0)]
+        to_left = share[(-1, 0)]
+        to_up_right = share[(1, -1)]
+        to_up = share[(0, -1)]
+        to_up_left = share[(-1, -1)]
         
-        total_weight = sum(WEIGHT_MATRIX.values())
+        cols = self.cols
         
-        new_food = [[0.0] * self.cols for _ in range(self.rows)]
-        new_nest = [[0.0] * self.cols for _ in range(self.rows)]
+        # Amount each cell sends out, with a zero border so edge cells
+        # receive nothing from outside the grid. Obstacles send nothing.
+        zero_row = [0.0] * (cols + 2)
+        sent = [zero_row]
+        for row, obstacle_row in zip(pheromone, self.obstacles):
+            if True in obstacle_row:
+                sent.append([0.0] + [0.0 if is_obstacle else value * rate
+                                     for value, is_obstacle in zip(row, obstacle_row)] + [0.0])
+            else:
+                sent.append([0.0] + [value * rate for value in row] + [0.0])
+        sent.append(zero_row)
         
+        diffused = []
         for row in range(self.rows):
-            for col in range(self.cols):
-                if self.obstacles[row][col]:
-                    continue
-                
-                current_food = self.pheromone_to_food[row][col]
-                current_nest = self.pheromone_to_nest[row][col]
-                
-                # Keep some in current cell
-                keep = 1 - Config.DIFFUSION_RATE
-                new_food[row][col] += current_food * keep
-                new_nest[row][col] += current_nest * keep
-                
-                # Distribute to neighbors by weight
-                for (dc, dr), weight in WEIGHT_MATRIX.items():
-                    nc = col + dc
-                    nr = row + dr
-                    
-                    if (0 <= nr < self.rows and 0 <= nc < self.cols and 
-                        not self.obstacles[nr][nc]):
-                        
-                        # Calculate amount for this neighbor
-                        amount_food = current_food * Config.DIFFUSION_RATE * (weight / total_weight)
-                        amount_nest = current_nest * Config.DIFFUSION_RATE * (weight / total_weight)
-                        
-                        new_food[nr][nc] += amount_food
-                        new_nest[nr][nc] += amount_nest
-        
-        self.pheromone_to_food = new_food
-        self.pheromone_to_nest = new_nest
+            above = sent[row]
+            current = sent[row + 1]
+            below = sent[row + 2]
+            new_row = [
+                from_up_left * to_down_right + from_up * to_down + from_up_right * to_down_left
+                + from_left * to_right + value * keep + from_right * to_left
+                + from_down_left * to_up_right + from_down * to_up + from_down_right * to_up_left
+                for (from_up_left, from_up, from_up_right,
+                     from_left, value, from_right,
+                     from_down_left, from_down, from_down_right)
+                in zip(above, above[1:], above[2:],
+                       current, pheromone[row], current[2:],
+                       below, below[1:], below[2:])
+            ]
+            
+            # Obstacle cells hold no pheromone
+            obstacle_row = self.obstacles[row]
+            if True in obstacle_row:
+                new_row = [0.0 if is_obstacle else value
+                           for value, is_obstacle in zip(new_row, obstacle_row)]
+            diffused.append(new_row)
+        
+        return diffused
 
     def update_pheromones(self, should_evaporate=True, should_diffuse=True):
         """
@@ -305,12 +356,17 @@ class Grid:
     def add_food_cluster(self, food_cluster_object):
         """Add a FoodCluster object to the grid."""
         self.food_clusters.append(food_cluster_object)
+        for cell in food_cluster_object.food_cells:
+            self.food_cell_to_cluster[cell] = food_cluster_object
         
-        # Update food heuristic
-        self.update_heuristic_to_food()
+        if self._food_heuristic_stale:
+            # Obstacles or food counts changed since the last rebuild
+            self.update_heuristic_to_food()
+        else:
+            # Merge in the new cluster's attraction; the existing clusters'
+            # values are already in the grid and still up to date
+            self._merge_cluster_heuristic(food_cluster_object)
         
-        print(f"Grid: Added food cluster at ({food_cluster_object.grid_x}, {food_cluster_object.grid_y}) "
-            f"radius={food_cluster_object.radius}, food={food_cluster_object.total_food}")
         return len(self.food_clusters) - 1  # Return cluster index
     
     def update_food_clusters(self):
@@ -349,42 +405,56 @@ class Grid:
 
     def get_food(self, grid_col, grid_row):
         """Get food object at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
-            return self.foods[grid_row][grid_col]
-        return None
+        return self.foods.get((grid_col, grid_row))
     
     def set_food(self, grid_col, grid_row, food_object):
         """Place food object at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
-            self.foods[grid_row][grid_col] = food_object
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
+            self.foods[(grid_col, grid_row)] = food_object
             return True
         return False
     
     def remove_food(self, grid_col, grid_row):
         """Remove food from grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
-            self.foods[grid_row][grid_col] = None
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
+            self.foods.pop((grid_col, grid_row), None)
+            self.food_cell_to_cluster.pop((grid_col, grid_row), None)
+            self._food_heuristic_stale = True
             return True
         return False
     
     def has_food(self, grid_col, grid_row):
         """Check if cell has food."""
-        return self.get_food(grid_col, grid_row) is not None
+        return self.foods.get((grid_col, grid_row)) is not None
 
     # Obstacle Methods
     def is_obstacle(self, grid_col, grid_row):
         """Check if cell is an obstacle."""
-        if self._in_bounds(grid_col, grid_row):
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
             return self.obstacles[grid_row][grid_col]
         return True  # Treat out-of-bounds as obstacles
     
     def set_obstacle(self, grid_col, grid_row, is_obstacle=True):
         """Set or clear obstacle at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
             self.obstacles[grid_row][grid_col] = is_obstacle
+            self.obstacle_padded[(grid_row + 1) * self.padded_stride + grid_col + 1] = bool(is_obstacle)
+            self._food_heuristic_stale = True
             return True
         return False
     
+    def clear_obstacles(self):
+        """Remove all obstacles (bulk version of set_obstacle(..., False))."""
+        empty_row = [False] * self.cols
+        for obstacle_row in self.obstacles:
+            obstacle_row[:] = empty_row
+        
+        empty_cells = bytes(self.cols)
+        for row in range(self.rows):
+            start = (row + 1) * self.padded_stride + 1
+            self.obstacle_padded[start:start + self.cols] = empty_cells
+        self._food_heuristic_stale = True
+    
     def draw_obstacles(self, surface, obstacle_color=(80, 80, 80)):
         """
         Draw all obstacles on the grid.
@@ -416,26 +486,26 @@ class Grid:
     # Heuristic Methods - updated for dual heuristics
     def get_heuristic_to_food(self, grid_col, grid_row):
         """Get food heuristic value at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
             return self.heuristic_to_food[grid_row][grid_col]
         return 0.0
     
     def get_heuristic_to_nest(self, grid_col, grid_row):
         """Get nest heuristic value at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
             return self.heuristic_to_nest[grid_row][grid_col]
         return 0.0
     
     def set_heuristic_to_food(self, grid_col, grid_row, value):
         """Set food heuristic value at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
             self.heuristic_to_food[grid_row][grid_col] = value
             return True
         return False
     
     def set_heuristic_to_nest(self, grid_col, grid_row, value):
         """Set nest heuristic value at grid coordinates."""
-        if self._in_bounds(grid_col, grid_row):
+        if 0 <= grid_row < self.rows and 0 <= grid_col < self.cols:
             self.heuristic_to_nest[grid_row][grid_col] = value
             return True
         return False
@@ -454,44 +524,94 @@ class Grid:
         """
 
         # Clear the heuristic grid
-        for r in range(self.rows):
-            for c in range(self.cols):
-                self.heuristic_to_food[r][c] = 0.0
+        zero_row = [0.0] * self.cols
+        for heuristic_row in self.heuristic_to_food:
+            heuristic_row[:] = zero_row
+        self._food_heuristic_stale = False
         
         if not self.food_clusters:
             return
         
         for cluster in self.food_clusters:
-            if len(cluster.food_cells) <= 0:
-                continue
-            
-            food_cell_count = len(cluster.food_cells)
-            influence_radius = cluster.radius * Config.FOOD_CLUSTER_INFLUENCE_RADIUS_MULT
-            
-            min_col = max(0, cluster.grid_x - influence_radius)
-            max_col = min(self.cols - 1, cluster.grid_x + influence_radius)
-            min_row = max(0, cluster.grid_y - influence_radius)
-            max_row = min(self.rows - 1, cluster.grid_y + influence_radius)
-            
-            # FIXED: Use different variable names r2, c2 for inner loops
-            for r2 in range(min_row, max_row + 1):
-                for c2 in range(min_col, max_col + 1):
-                    if self.obstacles[r2][c2]:
-                        continue
-                    
-                    dx = c2 - cluster.grid_x
-                    dy = r2 - cluster.grid_y    
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    if distance <= influence_radius:
+            self._merge_cluster_heuristic(cluster, gradient_softness)
+
+
+    def _merge_cluster_heuristic(self, cluster, gradient_softness=0.5):
+        """
+        Raise heuristic_to_food to this cluster's attraction wherever that
+        is higher. The grid holds the max over clusters, so a new cluster
+        can be merged in without rebuilding the others.
+        """
+        food_cell_count = len(cluster.food_cells)
+        if food_cell_count <= 0:
+            return
+        
+        heuristic = self.heuristic_to_food
+        obstacles = self.obstacles
+        
+        influence_radius = cluster.radius * Config.FOOD_CLUSTER_INFLUENCE_RADIUS_MULT
+        radius_sq = influence_radius * influence_radius
+        
+        center_col = cluster.grid_x
+        center_row = cluster.grid_y
+        min_row = max(0, center_row - influence_radius)
+        max_row = min(self.rows - 1, center_row + influence_radius)
+        
+        # The attraction only depends on the squared distance: compute
+        # each value once per cluster, and build the span of values for
+        # each |dy| once, then merge it into the rows it covers
+        span_by_dy = {}
+        attraction_by_dist_sq = {}
+        
+        for r2 in range(min_row, max_row + 1):
+            dy = abs(r2 - center_row)
+            span = span_by_dy.get(dy)
+            if span is None:
+                dy_sq = dy*dy
+                # Widest |dx| still inside the influence circle on this row
+                half_width = math.isqrt(int(radius_sq - dy_sq))
+                min_col = max(0, center_col - half_width)
+                max_col = min(self.cols - 1, center_col + half_width)
+                
+                by_dx = []
+                for dx in range(max(center_col - min_col, max_col - center_col) + 1):
+                    dist_sq = dx*dx + dy_sq
+                    sigmoid_attraction = attraction_by_dist_sq.get(dist_sq)
+                    if sigmoid_attraction is None:
+                        distance = math.sqrt(dist_sq)
                         raw_attraction = food_cell_count / (1.0 + distance * gradient_softness)
                         # Sigmoid: 1 / (1 + exp(-x))
                         scaled = raw_attraction * 0.1
                         sigmoid_attraction = 1.0 / (1.0 + math.exp(-scaled))
-                        self.heuristic_to_food[r2][c2] = max(
-                            self.heuristic_to_food[r2][c2],
-                            sigmoid_attraction
-                        )
+                        attraction_by_dist_sq[dist_sq] = sigmoid_attraction
+                    by_dx.append(sigmoid_attraction)
+                
+                if min_col <= center_col <= max_col:
+                    # Mirror the table around the center column
+                    attractions = (by_dx[center_col - min_col:0:-1]
+                                   + by_dx[:max_col - center_col + 1])
+                else:
+                    attractions = [by_dx[abs(c2 - center_col)] for c2 in range(min_col, max_col + 1)]
+                span = (min_col, max_col, attractions)
+                span_by_dy[dy] = span
+            
+            min_col, max_col, attractions = span
+            if min_col > max_col:
+                # The influence circle misses the grid on this row
+                continue
+            heuristic_row = heuristic[r2]
+            current = heuristic_row[min_col:max_col + 1]
+            obstacle_row = obstacles[r2]
+            if True in obstacle_row:
+                # Obstacle cells keep their cleared 0.0
+                heuristic_row[min_col:max_col + 1] = [
+                    value if is_obstacle or value >= attraction else attraction
+                    for attraction, value, is_obstacle
+                    in zip(attractions, current, obstacle_row[min_col:max_col + 1])]
+            else:
+                heuristic_row[min_col:max_col + 1] = [
+                    value if value >= attraction else attraction
+                    for attraction, value in zip(attractions, current)]
 
 
     def update_heuristic_to_nest(self, target_col=None, target_row=None, max_range=100):
@@ -504,30 +624,31 @@ class Grid:
                 return
             target_col, target_row = self.nest_position
         
+        # The value only depends on |dx| and |dy|: compute it once per
+        # distinct |dx| for each |dy|, then fill each row from that table
+        cols = self.cols
+        max_dx = max(abs(target_col), abs(cols - 1 - target_col))
+        dx_of_col = [abs(c - target_col) for c in range(cols)]
+        row_by_dy = {}
+        
         for r in range(self.rows):
-            for c in range(self.cols):
-                if self.obstacles[r][c]:
-                    self.heuristic_to_nest[r][c] = 0.0
-                    continue
-                
+            dy = abs(r - target_row)
+            row_values = row_by_dy.get(dy)
+            if row_values is None:
                 # Calculate diagonal-aware distance
-                dx = abs(c - target_col)
-                dy = abs(r - target_row)
-                diagonal_moves = min(dx, dy)
-                straight_moves = abs(dx - dy)
-                distance = (diagonal_moves * 1.414) + straight_moves
-                
-                if distance <= max_range:
-                    # Linear: 1.0 at nest, 0.0 at max_range
-                    self.heuristic_to_nest[r][c] = 1.0 - (distance / max_range)
-                else:
-                    self.heuristic_to_nest[r][c] = 0.0
-
-
-    # Utility Method (Private)
-    def _in_bounds(self, grid_col, grid_row):
-        """Check if grid coordinates are within bounds."""
-        return (0 <= grid_row < self.rows and 0 <= grid_col < self.cols)
+                distances = [(min(dx, dy) * 1.414) + abs(dx - dy) for dx in range(max_dx + 1)]
+                # Linear: 1.0 at nest, 0.0 at max_range
+                by_dx = [1.0 - (distance / max_range) if distance <= max_range else 0.0
+                         for distance in distances]
+                row_values = [by_dx[dx] for dx in dx_of_col]
+                row_by_dy[dy] = row_values
+            
+            obstacle_row = self.obstacles[r]
+            if True in obstacle_row:
+                self.heuristic_to_nest[r] = [0.0 if is_obstacle else value
+                                             for value, is_obstacle in zip(row_values, obstacle_row)]
+            else:
+                self.heuristic_to_nest[r] = row_values[:]
     
 
 
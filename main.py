@@ -1,16 +1,11 @@
 # MAIN.PY
 import pygame
 import sys
-import random
 from config import Config
 from grid import Grid
 from ant import Ant
-from food import FoodCluster, Food
 from editor import Editor
 
-import concurrent.futures
-from functools import partial
-
 # In main.py, update the AntSimulation class:
 
 class AntSimulation:
@@ -46,6 +41,7 @@ class AntSimulation:
         # Editor setup
         self.editor = Editor(self.grid, self.ants)
         self.editor_mode = False  # Toggle with key
+        self._update_event_filter()
 
         # Tuning mode
         self.tuning_mode = False
@@ -83,9 +79,19 @@ class AntSimulation:
         # Metrics display
         self.show_metrics = True
         self.metrics_font = pygame.font.Font(None, Config.METRICS_FONT_SIZE)
+        
+        # Fonts are loaded once; creating a Font re-reads the font file
+        self.hud_font = pygame.font.Font(None, 24)
+        self.editor_font = pygame.font.Font(None, 20)
         self.metrics_update_interval = Config.FPS  # Update every second
         self.metrics_counter = 0
 
+        # Pre-filled cell sprites so all ants can be drawn with one blits() call
+        self.ant_sprite = pygame.Surface((Config.CELL_SIZE, Config.CELL_SIZE))
+        self.ant_sprite.fill(Config.ANT_COLOR)
+        self.ant_with_food_sprite = pygame.Surface((Config.CELL_SIZE, Config.CELL_SIZE))
+        self.ant_with_food_sprite.fill(Config.ANT_WITH_FOOD_COLOR)
+
     def _update_metrics(self):
         """Update all metrics."""
         # Count ants with and without food
@@ -146,6 +152,18 @@ class AntSimulation:
         # Add current delivery time
         self.metrics['delivery_times'].append(current_time)
     
+    def _draw_ants(self):
+        """Draw all ants in a single batched blit."""
+        cell_size = self.grid.cell_size
+        ant_sprite = self.ant_sprite
+        food_sprite = self.ant_with_food_sprite
+        self.screen.blits(
+            [(food_sprite if ant.has_food else ant_sprite,
+              (ant.col * cell_size, ant.row * cell_size))
+             for ant in self.ants],
+            False
+        )
+    
     def _draw_food(self):
         """Draw all food clusters stored in grid."""
         for cluster in self.grid.food_clusters:
@@ -239,12 +257,18 @@ class AntSimulation:
             self.ph_counter = 0
 
         
-        # Single-threaded ant updates (fastest for <500 ants)
-        for ant in self.ants:
-            if self.movement_mode == "random":
-                ant.move_random()
-            elif self.movement_mode == "aco":
-                ant.move_aco()
+        # Single-threaded ant updates (fastest for <500 ants).
+        # Resolve the movement mode once per tick, not once per ant.
+        if self.movement_mode == "random":
+            step = Ant.move_random
+        elif self.movement_mode == "aco":
+            step = Ant.move_aco
+        else:
+            step = None
+
+        if step is not None:
+            for ant in self.ants:
+                step(ant)
 
         # Check if any food was delivered during this update
         food_dropped_this_frame = self.grid.food_dropped_this_frame
@@ -296,6 +320,13 @@ class AntSimulation:
             print(f"\n✓ {self.tuning_parameter.upper()} {operation}: {old_value:.3f} → {new_value:.3f}")
             
     
+    def _update_event_filter(self):
+        """Only queue mouse motion while the editor needs it (drag drawing)."""
+        if self.editor_mode:
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
+        else:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+
     # Add a key handler to print heuristics on demand
     def handle_events(self):
         """Handle pygame events."""
@@ -306,6 +337,7 @@ class AntSimulation:
             # FIRST: Always check for TAB to toggle editor mode
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
                 self.editor_mode = not self.editor_mode
+                self._update_event_filter()
                 print(f"\n✓ Editor mode: {'ON' if self.editor_mode else 'OFF'}")
                 continue  # Skip further processing
             
@@ -416,7 +448,7 @@ class AntSimulation:
     # Update HUD to show only FPS
     def _draw_hud(self):
         """Draw heads-up display - only FPS."""
-        font = pygame.font.Font(None, 24)
+        font = self.hud_font
         
         # Show FPS
         fps_text = f"FPS: {int(self.clock.get_fps())}"
@@ -498,9 +530,8 @@ class AntSimulation:
         self._draw_food()
         
         # Draw ants (on top)
-        for ant in self.ants:
-            if self.show_ants:
-                ant.draw(self.screen)
+        if self.show_ants:
+            self._draw_ants()
 
         self._draw_nest()
         
@@ -515,8 +546,7 @@ class AntSimulation:
         self._draw_hud()
         
         if self.editor_mode:
-            font = pygame.font.Font(None, 20)
-            self.editor.draw_ui(self.screen, font)
+            self.editor.draw_ui(self.screen, self.editor_font)
         
         pygame.display.flip()
     